@@ -8,7 +8,6 @@ from utils.profiles import (
     ProfileError,
     load_profile,
     list_profiles,
-    load_domains_index,
     flatten_domains_index,
     pick_lang,
 )
@@ -36,8 +35,8 @@ def render_profile_manager(cv: Dict[str, Any], lang: str = "en") -> Optional[Dic
 
     cv.setdefault("ats_profile", "cyber_security")
 
-    idx = load_domains_index()
-    flat = flatten_domains_index(idx)
+    # no-arg call: flattened once per domains_index.yaml version
+    flat = flatten_domains_index()
     groups: List[Dict[str, Any]] = flat.get("groups", []) if isinstance(flat.get("groups"), list) else []
     domains: List[Dict[str, Any]] = flat.get("domains", []) if isinstance(flat.get("domains"), list) else []
     by_id: Dict[str, Any] = flat.get("by_id", {}) if isinstance(flat.get("by_id"), dict) else {}
@@ -5,16 +5,24 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 JOB_PROFILES_DIR = "job_profiles"
+_DIR_ENSURED = False
+
+_SLUG_STRIP = re.compile(r"[^a-z0-9\-_\s]+")
+_SLUG_WS = re.compile(r"\s+")
 
 
 def _ensure_dir():
+    global _DIR_ENSURED
+    if _DIR_ENSURED:
+        return
     os.makedirs(JOB_PROFILES_DIR, exist_ok=True)
+    _DIR_ENSURED = True
 
 
 def _slugify(s: str) -> str:
     s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9\-_\s]+", "", s)
-    s = re.sub(r"\s+", "-", s).strip("-")
+    s = _SLUG_STRIP.sub("", s)
+    s = _SLUG_WS.sub("-", s).strip("-")
     return s[:80] if s else "job"
 
 
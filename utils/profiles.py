@@ -1,13 +1,30 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
 import os
 import re
 import sys
-import shutil
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-import yaml
+# PyYAML is imported on first parse/dump (see _yaml), not at module import
+_yaml_mod: Any = None
+_SafeLoader: Any = None
+_SafeDumper: Any = None
+
+
+def _yaml() -> Any:
+    global _yaml_mod, _SafeLoader, _SafeDumper
+    if _yaml_mod is None:
+        import yaml
+        # libyaml-backed loader/dumper when PyYAML was built with it
+        _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        _yaml_mod = yaml
+    return _yaml_mod
 
 
 class ProfileError(Exception):
@@ -37,11 +54,16 @@ def _user_data_root(app_name: str = "CVBuilder") -> Path:
     return Path.home() / ".local" / "share" / app_name
 
 
+# Resolved once: depends only on platform/environment at startup
+_USER_DATA_ROOT = _user_data_root("CVBuilder")
+
 # Where user-editable profiles live (persist between updates)
-ATS_ROOT_DIR = _user_data_root("CVBuilder") / "ats_profiles"
+ATS_ROOT_DIR = _USER_DATA_ROOT / "ats_profiles"
 USER_PROFILES_DIR = ATS_ROOT_DIR / "profiles"
 USER_LIBRARIES_DIR = ATS_ROOT_DIR / "libraries"
 USER_DOMAIN_LIB_DIR = USER_LIBRARIES_DIR / "domains"
+# Fingerprint of the bundled tree last copied in (see ensure_seeded)
+SEED_MARKER = ATS_ROOT_DIR / ".seeded"
 
 # Bundled/repo folders
 REPO_ATS_ROOT = Path("ats_profiles")
@@ -50,43 +72,271 @@ REPO_LIBRARIES_DIR = REPO_ATS_ROOT / "libraries"
 REPO_DOMAIN_LIB_DIR = REPO_LIBRARIES_DIR / "domains"
 
 
+# One-line quoted title without escapes (`title: "..."` / `title: '...'`): no YAML parse needed
+_QUOTED_TITLE_RE = re.compile(r"""^title:[ \t]+(?:"([^"\\]*)"|'([^']*)')(?:[ \t]+#.*)?[ \t]*$""")
+
+# Sentinel for "key not present" in single-lookup dict probes
+_MISSING = object()
+
+# CVB_FAST_DUMP=1: generated profiles are written as JSON (valid YAML) instead of via yaml.dump
+_CVB_FAST_DUMP = os.environ.get("CVB_FAST_DUMP") == "1"
+
+# Set once ensure_seeded() / _ensure_dirs() have completed for this process
+_SEEDED = False
+_DIRS_ENSURED = False
+
+# (path, (mtime_ns, size) or None if missing) for each file a result was built from
+_SourceSig = Tuple[Path, Optional[Tuple[int, int]]]
+
+# _load_yaml_file() parses: str(path) -> ((mtime_ns, size), data)
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# list_profiles() titles: file path -> (file_sig, raw title value)
+_TITLE_CACHE: Dict[str, Tuple[Optional[Tuple[int, int]], Any]] = {}
+
+# core library as merged by load_profile(): lang -> (file_sig, picked/cleaned layer)
+_CORE_LAYER_CACHE: Dict[str, Tuple[Optional[Tuple[int, int]], Dict[str, Any]]] = {}
+
+# flatten_domains_index() of the on-disk index: str(index path) -> (file_sig, flat)
+_FLAT_INDEX_CACHE: Dict[str, Tuple[Optional[Tuple[int, int]], Dict[str, Any]]] = {}
+
+# list_profiles() results: lang -> ((profile file sigs, domains index sig), entries)
+_LIST_CACHE: Dict[str, Tuple[Tuple[Any, ...], List[Dict[str, str]]]] = {}
+
+# load_profile() results: (profile_id, lang) -> (source signatures, profile)
+_LOAD_PROFILE_CACHE: Dict[Tuple[str, str], Tuple[Tuple[_SourceSig, ...], Dict[str, Any]]] = {}
+
+# _slugify: ASCII characters outside [a-z0-9-_ ] are deleted
+_SLUG_KEEP = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-_ ")
+_SLUG_DROP = {i: None for i in range(128) if chr(i) not in _SLUG_KEEP}
+
+# Normalized keyword buckets
+_KEYWORD_BUCKETS: Tuple[str, ...] = ("core", "technologies", "tools", "certifications", "frameworks", "soft_skills")
+# Legacy keyword groups, folded into technologies (in this order)
+_LEGACY_TECH_BUCKETS: Tuple[str, ...] = ("services", "platforms", "languages", "concepts")
+_LEGACY_TECH_KEYS = frozenset(_LEGACY_TECH_BUCKETS)
+
+# load_profile merge: keys where the later layer wins vs. keys that are concatenated
+_MERGE_OVERRIDE_KEYS = ("id", "domain", "title", "job_titles", "ats_hint", "notes", "section_priority")
+_MERGE_LIST_KEYS = ("action_verbs", "metrics", "bullet_templates")
+
+_SECTION_NORM_MAP: Dict[str, str] = {
+    "experience": "Professional Experience",
+    "experience / projects": "Professional Experience",
+    "projects": "Professional Experience",
+    "work experience": "Professional Experience",
+    "skills": "Technical Skills",
+    "key skills": "Technical Skills",
+    "technical skills": "Technical Skills",
+    "summary": "Summary",
+    "education": "Education",
+    "certifications": "Certifications",
+}
+_DEFAULT_SECTION_PRIORITY: Tuple[str, ...] = (
+    "Professional Experience", "Summary", "Technical Skills", "Education", "Certifications",
+)
+_DEFAULT_BULLET_TEMPLATES: Tuple[str, ...] = (
+    "Delivered {scope} improvements using {tool_or_tech}; reduced {metric} by {value}.",
+    "Implemented {control_or_feature} across {environment}; improved reliability/security and documented SOPs.",
+)
+
+
 # ---------------------------
 # Helpers
 # ---------------------------
 def _ensure_dirs() -> None:
+    global _DIRS_ENSURED
+    if _DIRS_ENSURED:
+        return
     USER_PROFILES_DIR.mkdir(parents=True, exist_ok=True)
     USER_DOMAIN_LIB_DIR.mkdir(parents=True, exist_ok=True)
+    _DIRS_ENSURED = True
 
 
-def _is_frozen() -> bool:
-    return bool(getattr(sys, "frozen", False)) and hasattr(sys, "_MEIPASS")
+_IS_FROZEN = bool(getattr(sys, "frozen", False)) and hasattr(sys, "_MEIPASS")
 
 
 def _bundle_root() -> Optional[Path]:
     """
     If running from PyInstaller, resources are under sys._MEIPASS.
     """
-    if not _is_frozen():
+    if not _IS_FROZEN:
         return None
     base = Path(getattr(sys, "_MEIPASS"))  # type: ignore
     cand = base / "ats_profiles"
     return cand if cand.exists() else None
 
 
-def _read_text(path: Path) -> str:
+_BUNDLE_ROOT = _bundle_root()
+
+
+def _read_bytes(path: Path) -> bytes:
     try:
-        return path.read_text(encoding="utf-8")
+        return path.read_bytes()
     except FileNotFoundError:
         raise ProfileError(f"Profile not found: {path}")
     except Exception as e:
         raise ProfileError(f"Failed to read profile: {e}")
 
 
+def _file_sig(path: Union[str, Path]) -> Optional[Tuple[int, int]]:
+    """
+    (mtime_ns, size) used to detect on-disk changes; None if the file is missing.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_title_header(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads the top-level `title:` entry of a profile YAML (plain scalar or
+    nested en/ro block) with a line scan, parsing only that entry.
+    Returns {"title": ...}, or None if not found / not parseable, or when the
+    file needs a real parse (flow-style root, duplicate `title:` keys,
+    several documents, tab indentation).
+    """
+    lines: List[str] = []
+    in_entry = False
+    stopped = False  # entry ended on a column-0 line (not at EOF)
+    seen_content = False
+    # utf-8-sig: a leading BOM (Windows editors) must not hide `title:` on line 1
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            if not seen_content:
+                head = line.lstrip()
+                if head and head[0] != "#" and head.rstrip() != "---":
+                    seen_content = True
+                    if head[0] in "{[":
+                        # flow root ({id: x, title: y, ...}): lines are not entries
+                        return None
+            if in_entry:
+                # indented/blank lines, column-0 comments and column-0 sequence
+                # items (safe_dump's list style) still belong to the entry
+                if (
+                    line[:1] in (" ", "\t", "#")
+                    or line[:2] in ("- ", "-\t")
+                    or line.rstrip("\r\n") == "-"
+                    or not line.strip()
+                ):
+                    lines.append(line)
+                    continue
+                in_entry = False
+                stopped = True
+            # keep scanning to EOF (cheap, no parse) for what a full load would
+            # reject or resolve differently
+            if line[:1] == "\t" or (line[:3] in ("---", "...") and line[3:4] in ("", " ", "\t", "\r", "\n")):
+                # tab indentation / a second document: leave it to a real parse
+                if seen_content:
+                    return None
+            if line.startswith("title:"):
+                if lines:
+                    # duplicate key: YAML (and load_profile) keep the last one
+                    return None
+                lines.append(line)
+                in_entry = True
+    if not lines:
+        return None
+    if not any(line.strip() for line in lines[1:]):
+        m = _QUOTED_TITLE_RE.match(lines[0].rstrip("\r\n"))
+        if m:
+            return {"title": m.group(1) if m.group(1) is not None else m.group(2)}
+    yaml = _yaml()
+    try:
+        data = yaml.load("".join(lines), Loader=_SafeLoader)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    if stopped and data.get("title") in (None, ""):
+        # the value may continue past a line the scan can't classify; let the
+        # event/full-parse fallbacks decide
+        return None
+    return data
+
+
+def _read_title_events(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Locates the root-level `title` entry with the event parser (no objects
+    built for the rest of the file) and parses just that slice; the last
+    entry wins and syntax errors anywhere give None, as in a full load.
+    Covers flow/JSON-style files and duplicate keys the line scan above can't.
+    Returns {"title": ...}, or None if not found / not parseable.
+    """
+    yaml = _yaml()
+    # utf-8-sig drops a leading BOM, which libyaml's marks do not count
+    with open(path, "r", encoding="utf-8-sig") as f:
+        text = f.read()
+    depth = 0
+    is_key = True  # next root-level node is a key
+    title_start = -1
+    title_slice: Optional[Tuple[int, int]] = None
+    root_done = False
+    try:
+        for ev in yaml.parse(text, Loader=_SafeLoader):
+            if root_done:
+                # drain to the end of the stream: later errors or a second
+                # document make a full load fail too
+                if isinstance(ev, yaml.DocumentStartEvent):
+                    return None
+                continue
+            if isinstance(ev, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                if depth == 0 and not isinstance(ev, yaml.MappingStartEvent):
+                    return None
+                depth += 1
+                continue
+            if isinstance(ev, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+                if depth != 1:
+                    if depth == 0:
+                        root_done = True  # end of the root mapping
+                    continue
+            elif isinstance(ev, (yaml.ScalarEvent, yaml.AliasEvent)):
+                if depth != 1:
+                    if depth == 0:
+                        return None
+                    continue
+            else:
+                continue
+            # a root-level node just ended
+            if is_key:
+                title_start = -1
+                if isinstance(ev, yaml.ScalarEvent) and ev.value == "title":
+                    title_start = ev.start_mark.index
+            elif title_start >= 0:
+                title_slice = (title_start, ev.end_mark.index)
+            is_key = not is_key
+        if title_slice is None:
+            return None
+        data = yaml.load(text[title_slice[0]:title_slice[1]], Loader=_SafeLoader)
+    except yaml.YAMLError:
+        return None
+    return data if isinstance(data, dict) and "title" in data else None
+
+
 def _write_text(path: Path, text: str) -> None:
+    # encode once, single write
+    _write_atomic(path, lambda f: f.write(text.encode("utf-8")))
+
+
+def _write_atomic(path: Path, write: Callable[[BinaryIO], Any]) -> None:
+    """
+    `write` fills a sibling temp file, which then replaces path (os.replace),
+    so readers never see a half-written profile.
+    """
+    tmp = path.with_name(path.name + ".tmp")
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(text, encoding="utf-8")
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
     except Exception as e:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
         raise ProfileError(f"Failed to write profile: {e}")
 
 
@@ -94,10 +344,14 @@ def _safe_list(x: Any) -> List[str]:
     if x is None:
         return []
     if isinstance(x, list):
-        return [str(i).strip() for i in x if str(i).strip()]
+        if all(type(i) is str for i in x):
+            # common case: already a list of strings -> one strip per item
+            return [s for s in map(str.strip, x) if s]
+        return [s for s in map(str.strip, map(str, x)) if s]
     if isinstance(x, str):
-        return [s.strip() for s in x.splitlines() if s.strip()]
-    return [str(x).strip()] if str(x).strip() else []
+        return [s for s in map(str.strip, x.splitlines()) if s]
+    s = str(x).strip()
+    return [s] if s else []
 
 
 def _safe_dict(x: Any) -> Dict[str, Any]:
@@ -106,8 +360,8 @@ def _safe_dict(x: Any) -> Dict[str, Any]:
 
 def _slugify(s: str) -> str:
     s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9\-_ ]+", "", s)
-    s = re.sub(r"\s+", "_", s).strip("_")
+    s = s.encode("ascii", "ignore").decode("ascii").translate(_SLUG_DROP)
+    s = "_".join(s.split()).strip("_")
     return s or "profile"
 
 
@@ -116,50 +370,54 @@ def pick_lang(val: Any, lang: str = "en") -> Any:
     If val is dict with 'en'/'ro', pick matching language; fallback to other.
     Otherwise return val unchanged.
     """
-    if isinstance(val, dict):
-        if lang in val:
-            return val.get(lang)
-        if "en" in val:
-            return val.get("en")
-        if "ro" in val:
-            return val.get("ro")
-        for _, v in val.items():
+    # YAML only produces plain dicts; exact type check is cheaper than isinstance
+    if type(val) is not dict:
+        return val
+    # one lookup per candidate key; a present key wins even if its value is empty
+    v = val.get(lang, _MISSING)
+    if v is not _MISSING:
+        return v
+    if lang != "en":
+        v = val.get("en", _MISSING)
+        if v is not _MISSING:
+            return v
+    if lang != "ro":
+        v = val.get("ro", _MISSING)
+        if v is not _MISSING:
             return v
-    return val
+    return next(iter(val.values()), val)
 
 
-def _dedupe_preserve(items: List[str]) -> List[str]:
-    seen = set()
-    out: List[str] = []
+def _dedupe_preserve(items: Iterable[str]) -> List[str]:
+    # lowercased key -> first spelling seen (dicts keep insertion order);
+    # kept strings are interned so profiles sharing library terms share storage
+    out: Dict[str, str] = {}
     for it in items:
         s = (it or "").strip()
-        if not s:
-            continue
-        key = s.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(s)
-    return out
+        if s:
+            key = s.lower()
+            if key not in out:
+                out[key] = sys.intern(s)
+    return list(out.values())
 
 
-def _merge_lists(base: List[str], extra: List[str]) -> List[str]:
-    return _dedupe_preserve(list(base) + list(extra))
+def _clean_dedupe(x: Any, lang: str = "en") -> List[str]:
+    """
+    _dedupe_preserve(_safe_list(pick_lang(x, lang))) in one pass when the
+    picked value is already a list of strings (_dedupe_preserve strips and
+    drops blanks itself, so the _safe_list copy is skipped).
+    """
+    x = pick_lang(x, lang=lang)
+    if type(x) is list and all(type(i) is str for i in x):
+        return _dedupe_preserve(x)
+    return _dedupe_preserve(_safe_list(x))
 
 
 def _flatten_metrics(metrics: Any, lang: str = "en") -> List[str]:
     metrics = pick_lang(metrics, lang=lang)
-    if metrics is None:
-        return []
-    if isinstance(metrics, list):
-        return _safe_list(metrics)
     if isinstance(metrics, dict):
-        flat: List[str] = []
-        for _, v in metrics.items():
-            flat.extend(_safe_list(v))
-        return _safe_list(flat)
-    if isinstance(metrics, str):
-        return _safe_list(metrics)
+        # grouped metrics {group: [...]}: each group is already cleaned by _safe_list
+        return list(chain.from_iterable(_safe_list(v) for v in metrics.values()))
     return _safe_list(metrics)
 
 
@@ -167,10 +425,7 @@ def _normalize_templates(x: Any, lang: str = "en") -> List[str]:
     x = pick_lang(x, lang=lang)
     t = _safe_list(x)
     if len(t) < 2:
-        t.extend([
-            "Delivered {scope} improvements using {tool_or_tech}; reduced {metric} by {value}.",
-            "Implemented {control_or_feature} across {environment}; improved reliability/security and documented SOPs.",
-        ])
+        t.extend(_DEFAULT_BULLET_TEMPLATES)
     return t
 
 
@@ -178,22 +433,18 @@ def _normalize_section_priority(x: Any, lang: str = "en") -> List[str]:
     x = pick_lang(x, lang=lang)
     items = _safe_list(x)
     if not items:
-        return ["Professional Experience", "Summary", "Technical Skills", "Education", "Certifications"]
-
-    norm_map = {
-        "experience": "Professional Experience",
-        "experience / projects": "Professional Experience",
-        "projects": "Professional Experience",
-        "work experience": "Professional Experience",
-        "skills": "Technical Skills",
-        "key skills": "Technical Skills",
-        "technical skills": "Technical Skills",
-        "summary": "Summary",
-        "education": "Education",
-        "certifications": "Certifications",
-    }
-    out = [norm_map.get(s.strip().lower(), s) for s in items]
-    return _dedupe_preserve(out)
+        return list(_DEFAULT_SECTION_PRIORITY)
+
+    seen = set()
+    out: List[str] = []
+    for s in items:
+        name = _SECTION_NORM_MAP.get(s.lower(), s)
+        key = name.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(name)
+    return out
 
 
 # ---------------------------
@@ -204,35 +455,91 @@ def _seed_from_source(src_root: Path) -> None:
     Copy ats_profiles from src_root into USER ATS_ROOT_DIR if missing.
     Does not overwrite user's existing files.
     """
-    _ensure_dirs()
+    import shutil  # only needed on the (rare) seeding path
+    from concurrent.futures import Future, ThreadPoolExecutor
 
-    def copy_tree_if_missing(src: Path, dst: Path) -> None:
-        if not src.exists():
-            return
-        dst.mkdir(parents=True, exist_ok=True)
-        for p in src.rglob("*"):
-            if p.is_dir():
-                continue
-            rel = p.relative_to(src)
-            out = dst / rel
-            if out.exists():
-                continue
-            out.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(p, out)
-
-    # 1) profiles: allow both root-yaml and profiles/
-    if src_root.exists():
-        for fn in src_root.glob("*.yaml"):
-            out = USER_PROFILES_DIR / fn.name
-            if not out.exists():
-                shutil.copy2(fn, out)
-
-    if (src_root / "profiles").exists():
-        copy_tree_if_missing(src_root / "profiles", USER_PROFILES_DIR)
+    _ensure_dirs()
 
-    # 2) libraries
-    if (src_root / "libraries").exists():
-        copy_tree_if_missing(src_root / "libraries", USER_LIBRARIES_DIR)
+    # copies are independent and I/O-bound (the GIL is released in read/write);
+    # contents only: seeded files need no copied mode/timestamps. Every folder is
+    # created (and never touched again) before any copy into it is submitted.
+    pending: List[Future] = []
+    # destinations already handed to the pool: a queued copy may not have
+    # created its file yet, and the first source scheduled for a path wins
+    scheduled = set()
+    with ThreadPoolExecutor(max_workers=8) as ex:
+
+        def copy_file(src: str, dst: str) -> None:
+            scheduled.add(os.path.normpath(dst))
+            pending.append(ex.submit(shutil.copyfile, src, dst))
+
+        def copy_tree_if_missing(src: str, dst: str) -> None:
+            if not os.path.isdir(src):
+                return
+            for dirpath, _, files in os.walk(src):
+                out_dir = os.path.normpath(os.path.join(dst, os.path.relpath(dirpath, src)))
+                # plain makedirs, no copied directory metadata: the user's folders
+                # must stay writable even when the bundle is read-only
+                os.makedirs(out_dir, exist_ok=True)
+                for n in files:
+                    out = os.path.join(out_dir, n)
+                    # never overwrite user files (or pending copies)
+                    if out in scheduled or os.path.isfile(out):
+                        continue
+                    copy_file(os.path.join(dirpath, n), out)
+
+        # plain str paths from here on: no Path object per join/lookup
+        src_s = os.fspath(src_root)
+        profiles_dst = os.fspath(USER_PROFILES_DIR)
+
+        # 1) profiles: allow both root-yaml and profiles/
+        if os.path.isdir(src_s):
+            # DirEntry carries the type from readdir: no stat per entry
+            with os.scandir(src_s) as it:
+                root_yaml = [e for e in it if e.name.endswith(".yaml") and e.is_file()]
+            for e in root_yaml:
+                out = os.path.join(profiles_dst, e.name)
+                if not os.path.exists(out):
+                    copy_file(e.path, out)
+
+        copy_tree_if_missing(os.path.join(src_s, "profiles"), profiles_dst)
+
+        # 2) libraries
+        copy_tree_if_missing(os.path.join(src_s, "libraries"), os.fspath(USER_LIBRARIES_DIR))
+
+    for f in pending:
+        f.result()  # re-raise the first copy error, as the serial copy did
+
+
+def _seed_targets(src_root: Path) -> List[str]:
+    """
+    Relative paths (under ATS_ROOT_DIR) that seeding from src_root fills in,
+    from readdir only (no stats): root *.yaml, profiles/** and libraries/**.
+    """
+    targets: List[str] = []
+    for root, dirs, files in os.walk(src_root):
+        rel = os.path.relpath(root, src_root)
+        if rel == os.curdir:
+            # root yaml files land in profiles/; only these folders are copied
+            targets.extend(os.path.join("profiles", f) for f in files if f.endswith(".yaml"))
+            dirs[:] = [d for d in dirs if d in ("profiles", "libraries")]
+        else:
+            targets.extend(os.path.join(rel, f) for f in files)
+    return targets
+
+
+def _seed_incomplete(targets: List[str]) -> bool:
+    """
+    True when any seeded file is missing from the user folder (deleted by the
+    user, or a partial first run); readdir only, like the source walk.
+    """
+    present = set()
+    for sub in ("profiles", "libraries"):
+        top = os.path.join(ATS_ROOT_DIR, sub)
+        for root, _, files in os.walk(top):
+            rel = os.path.relpath(root, ATS_ROOT_DIR)
+            present.update(os.path.join(rel, f) for f in files)
+    return any(t not in present for t in targets)
 
 
 def ensure_seeded() -> None:
@@ -240,16 +547,48 @@ def ensure_seeded() -> None:
     Ensure ATS folder exists and is prepopulated from:
     - PyInstaller bundle ats_profiles/ (if frozen)
     - repo ats_profiles/ (if running from source)
+
+    Runs once per process; later calls return immediately.
     """
+    global _SEEDED
+    if _SEEDED:
+        return
+
     _ensure_dirs()
 
-    b = _bundle_root()
-    if b is not None and b.exists():
-        _seed_from_source(b)
-        return
+    src: Optional[Path] = None
+    if _BUNDLE_ROOT is not None:
+        src = _BUNDLE_ROOT
+    elif REPO_ATS_ROOT.exists():
+        src = REPO_ATS_ROOT
+
+    if src is not None:
+        # skip the per-file copy walk when this exact source was already seeded
+        # and every file it seeded is still there
+        targets = _seed_targets(src)
+        fingerprint = hashlib.sha1("\n".join(sorted(targets)).encode("utf-8")).hexdigest()
+        try:
+            seeded = SEED_MARKER.read_text(encoding="utf-8")
+        except OSError:
+            seeded = ""
+        if seeded != fingerprint or _seed_incomplete(targets):
+            _seed_from_source(src)
+            try:
+                SEED_MARKER.write_text(fingerprint, encoding="utf-8")
+            except OSError:
+                pass
 
-    if REPO_ATS_ROOT.exists():
-        _seed_from_source(REPO_ATS_ROOT)
+    _SEEDED = True
+
+
+def reset_seed_cache() -> None:
+    """
+    Forget that seeding/dir creation already ran in this process (tests, or
+    after the user data folder was removed) so the next call redoes it.
+    """
+    global _SEEDED, _DIRS_ENSURED
+    _SEEDED = False
+    _DIRS_ENSURED = False
 
 
 # ---------------------------
@@ -261,6 +600,12 @@ def profile_path(profile_id: str) -> Path:
     Accepts both "cyber_security" and "cyber_security.yaml"
     """
     ensure_seeded()
+    return _profile_file(profile_id)
+
+
+# The helpers below skip ensure_seeded(): their callers (load_profile,
+# save_profile_dict) have already run it.
+def _profile_file(profile_id: str) -> Path:
     pid = (profile_id or "").strip()
     if not pid:
         raise ProfileError("Empty profile id")
@@ -270,12 +615,10 @@ def profile_path(profile_id: str) -> Path:
 
 
 def _core_library_path() -> Path:
-    ensure_seeded()
     return USER_LIBRARIES_DIR / "core_en_ro.yaml"
 
 
 def _domain_library_path(domain_id: str) -> Path:
-    ensure_seeded()
     did = (domain_id or "").strip()
     if not did:
         return USER_DOMAIN_LIB_DIR / "_missing_.yaml"
@@ -285,34 +628,52 @@ def _domain_library_path(domain_id: str) -> Path:
 
 
 def _load_yaml_file(path: Path) -> Dict[str, Any]:
-    if not path.exists():
+    """
+    Parse a YAML mapping; {} if the file is missing.
+    Parsed results are cached per path and reused while (mtime, size) match.
+    Callers get their own deep copy, so mutating it never touches the cache.
+    """
+    sig = _file_sig(path)
+    if sig is None:
         return {}
-    raw = yaml.safe_load(_read_text(path))
+    key = str(path)
+    hit = _YAML_CACHE.get(key)
+    if hit is not None and hit[0] == sig:
+        return copy.deepcopy(hit[1])
+
+    # libyaml decodes UTF-8 itself, so hand it the raw bytes
+    yaml = _yaml()
+    raw = yaml.load(_read_bytes(path), Loader=_SafeLoader)
     if raw is None:
-        return {}
+        raw = {}
     if not isinstance(raw, dict):
         raise ProfileError(f"Invalid YAML in {path.name}: root must be a mapping/object")
-    return raw
+    if isinstance(raw.get("keywords"), dict):
+        _migrate_legacy_keyword_buckets(raw["keywords"])
+    _YAML_CACHE[key] = (sig, raw)
+    return copy.deepcopy(raw)
 
 
 # ---------------------------
 # Domains index (UI filter + mapping)
 # ---------------------------
+def _domains_index_path() -> Optional[Path]:
+    p = USER_PROFILES_DIR / "domains_index.yaml"
+    if p.exists():
+        return p
+    # allow legacy in root of ats_profiles (source run)
+    p2 = REPO_ATS_ROOT / "domains_index.yaml"
+    return p2 if p2.exists() else None
+
+
 def load_domains_index() -> Dict[str, Any]:
     """
     Loads ats_profiles/domains_index.yaml if present.
     Returns {} if missing.
     """
     ensure_seeded()
-    p = USER_PROFILES_DIR / "domains_index.yaml"
-    if not p.exists():
-        # allow legacy in root of ats_profiles (source run)
-        p2 = REPO_ATS_ROOT / "domains_index.yaml"
-        if p2.exists():
-            try:
-                return _load_yaml_file(p2)
-            except Exception:
-                return {}
+    p = _domains_index_path()
+    if p is None:
         return {}
     try:
         return _load_yaml_file(p)
@@ -331,7 +692,22 @@ def flatten_domains_index(index: Optional[Dict[str, Any]] = None) -> Dict[str, A
         "by_id": {id -> domain_dict}
       }
     """
-    idx = index if isinstance(index, dict) else load_domains_index()
+    if isinstance(index, dict):
+        return _build_flat_domains(index)
+
+    # on-disk index: flatten once per file version
+    ensure_seeded()
+    p = _domains_index_path()
+    key = str(p)
+    sig = _file_sig(p) if p is not None else None
+    hit = _FLAT_INDEX_CACHE.get(key)
+    if hit is None or hit[0] != sig:
+        hit = (sig, _build_flat_domains(load_domains_index()))
+        _FLAT_INDEX_CACHE[key] = hit
+    return copy.deepcopy(hit[1])
+
+
+def _build_flat_domains(idx: Dict[str, Any]) -> Dict[str, Any]:
     out = {"groups": [], "domains": [], "by_id": {}}
 
     groups = idx.get("groups")
@@ -391,26 +767,40 @@ def validate_profile(profile: Dict[str, Any]) -> Tuple[bool, List[str]]:
     return True, warnings
 
 
+def _migrate_legacy_keyword_buckets(kw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Folds legacy services/platforms/languages/concepts buckets into technologies,
+    in place, and returns kw. Bilingual (en/ro) values are merged per language.
+    """
+    legacy = [kw.pop(k) for k in _LEGACY_TECH_BUCKETS if k in kw]
+    if not legacy:
+        return kw
+
+    parts = [kw.get("technologies")] + legacy
+    langs: List[str] = []
+    for part in parts:
+        if isinstance(part, dict):
+            langs.extend(k for k in part if k not in langs)
+
+    if langs:
+        kw["technologies"] = {
+            lang: [s for part in parts for s in _safe_list(pick_lang(part, lang))]
+            for lang in langs
+        }
+    else:
+        kw["technologies"] = [s for part in parts for s in _safe_list(part)]
+    return kw
+
+
 def _normalize_keywords(profile: Dict[str, Any], lang: str) -> Dict[str, List[str]]:
     kw = _safe_dict(profile.get("keywords"))
-
-    # legacy groups into technologies
-    technologies = _merge_lists(_safe_list(pick_lang(kw.get("technologies"), lang)), _safe_list(pick_lang(kw.get("services"), lang)))
-    technologies = _merge_lists(technologies, _safe_list(pick_lang(kw.get("platforms"), lang)))
-    technologies = _merge_lists(technologies, _safe_list(pick_lang(kw.get("languages"), lang)))
-    technologies = _merge_lists(technologies, _safe_list(pick_lang(kw.get("concepts"), lang)))
-
-    out = {
-        "core": _safe_list(pick_lang(kw.get("core"), lang)),
-        "technologies": technologies,
-        "tools": _safe_list(pick_lang(kw.get("tools"), lang)),
-        "certifications": _safe_list(pick_lang(kw.get("certifications"), lang)),
-        "frameworks": _safe_list(pick_lang(kw.get("frameworks"), lang)),
-        "soft_skills": _safe_list(pick_lang(kw.get("soft_skills"), lang)),
+    # files read via _load_yaml_file are already migrated; only direct callers hit this
+    if not _LEGACY_TECH_KEYS.isdisjoint(kw):
+        kw = _migrate_legacy_keyword_buckets(dict(kw))
+    return {
+        bucket: _clean_dedupe(kw.get(bucket), lang)
+        for bucket in _KEYWORD_BUCKETS
     }
-    for k in list(out.keys()):
-        out[k] = _dedupe_preserve(out[k])
-    return out
 
 
 def normalize_profile(profile: Dict[str, Any], fallback_id: str = "", lang: str = "en") -> Dict[str, Any]:
@@ -434,7 +824,7 @@ def normalize_profile(profile: Dict[str, Any], fallback_id: str = "", lang: str
     p["job_titles"] = _safe_list(pick_lang(p.get("job_titles"), lang=lang))
     p["keywords"] = _normalize_keywords(p, lang=lang)
 
-    p["action_verbs"] = _dedupe_preserve(_safe_list(pick_lang(p.get("action_verbs"), lang=lang)))
+    p["action_verbs"] = _clean_dedupe(p.get("action_verbs"), lang=lang)
     p["metrics"] = _dedupe_preserve(_flatten_metrics(p.get("metrics"), lang=lang))
     p["bullet_templates"] = _normalize_templates(p.get("bullet_templates"), lang=lang)
     p["section_priority"] = _normalize_section_priority(p.get("section_priority"), lang=lang)
@@ -445,45 +835,97 @@ def normalize_profile(profile: Dict[str, Any], fallback_id: str = "", lang: str
     return p
 
 
-def _merge_profile_like(base: Dict[str, Any], extra: Dict[str, Any], lang: str) -> Dict[str, Any]:
+def _merge_overrides(layers: Tuple[Dict[str, Any], ...]) -> Dict[str, Any]:
     """
-    Merge profile-like dicts. base <- extra.
-    - list-ish fields: concat + dedupe after lang pick.
-    - keywords: merge buckets.
-    - other keys: profile overrides libs.
+    Simple overrides (id/domain/title/job_titles/ats_hint/notes/section_priority):
+    the highest-priority layer (last) with a non-empty value wins - profile
+    overrides libs. One pass per key, no intermediate dict per layer.
     """
-    out = dict(base or {})
-    if not isinstance(extra, dict) or not extra:
-        return out
+    out: Dict[str, Any] = {}
+    for k in _MERGE_OVERRIDE_KEYS:
+        for layer in reversed(layers):
+            v = layer.get(k)
+            if v not in (None, "", [], {}):
+                out[k] = v
+                break
+    return out
+
+
+def _merge_list_fields(layers: Tuple[Dict[str, Any], ...], lang: str) -> Dict[str, List[str]]:
+    """
+    Concat + dedupe the list-like fields (support bilingual dict) of all layers,
+    lowest priority first, in one pass per field. Fields no layer sets are omitted.
+    """
+    out: Dict[str, List[str]] = {}
+    for k in _MERGE_LIST_KEYS:
+        # layers that do not set the field are skipped outright
+        parts = [_safe_list(pick_lang(layer[k], lang=lang)) for layer in layers if k in layer]
+        if any(parts):
+            out[k] = _dedupe_preserve(chain.from_iterable(parts))
+    return out
+
+
+def _merge_keywords(layers: Iterable[Dict[str, Any]], lang: str) -> Optional[Dict[str, List[str]]]:
+    """
+    Merge keyword buckets of all layers (lowest priority first) in one dedupe
+    pass per bucket. Returns None when no layer has keywords.
+    """
+    kws = [kw for kw in (_safe_dict(layer.get("keywords")) for layer in layers) if kw]
+    if not kws:
+        return None
+    # buckets a layer does not define are skipped (no pick/_safe_list on None)
+    return {
+        b: _dedupe_preserve(chain.from_iterable(_safe_list(pick_lang(kw[b], lang=lang)) for kw in kws if b in kw))
+        for b in _KEYWORD_BUCKETS
+    }
 
-    # simple overrides (id/domain/title/job_titles/ats_hint/notes/section_priority)
-    for k in ("id", "domain", "title", "job_titles", "ats_hint", "notes", "section_priority"):
-        if k in extra and extra.get(k) not in (None, "", [], {}):
-            out[k] = extra.get(k)
-
-    # merge list-like fields (support bilingual dict)
-    for k in ("action_verbs", "metrics", "bullet_templates"):
-        a = _safe_list(pick_lang(out.get(k), lang=lang))
-        b = _safe_list(pick_lang(extra.get(k), lang=lang))
-        if b:
-            out[k] = _merge_lists(a, b)
-
-    # keywords buckets
-    base_kw = _safe_dict(out.get("keywords"))
-    extra_kw = _safe_dict(extra.get("keywords"))
-    if extra_kw:
-        buckets = ["core", "technologies", "tools", "certifications", "frameworks", "soft_skills"]
-        merged_kw: Dict[str, Any] = dict(base_kw)
-        for b in buckets:
-            merged_kw[b] = _merge_lists(
-                _safe_list(pick_lang(base_kw.get(b), lang=lang)),
-                _safe_list(pick_lang(extra_kw.get(b), lang=lang)),
-            )
-        out["keywords"] = merged_kw
 
+def _core_layer(path: Path, sig: Optional[Tuple[int, int]], lang: str) -> Dict[str, Any]:
+    """
+    The core library reduced to what the merge reads, for one language:
+    override keys as-is, list fields and keyword buckets already picked and
+    cleaned. Built once per (lang, file version) instead of deep-copying and
+    re-picking the whole bilingual library on every load_profile.
+    """
+    hit = _CORE_LAYER_CACHE.get(lang)
+    if hit is None or hit[0] != sig:
+        core = _load_yaml_file(path)
+        layer: Dict[str, Any] = {k: core[k] for k in _MERGE_OVERRIDE_KEYS if k in core}
+        for k in _MERGE_LIST_KEYS:
+            if k in core:
+                layer[k] = _safe_list(pick_lang(core[k], lang=lang))
+        kw = _safe_dict(core.get("keywords"))
+        if kw:
+            layer["keywords"] = {b: _clean_dedupe(kw.get(b), lang) for b in _KEYWORD_BUCKETS}
+        _CORE_LAYER_CACHE[lang] = (sig, layer)
+    else:
+        layer = hit[1]
+    # list fields/buckets are only read by the merge; override values can end
+    # up in the returned profile, so those are handed out as copies
+    out = dict(layer)
+    for k in _MERGE_OVERRIDE_KEYS:
+        if k in out:
+            out[k] = copy.deepcopy(out[k])
     return out
 
 
+def _read_profile_title(path: str) -> Any:
+    """
+    Raw `title` value of a profile file (may be an en/ro dict); None if unavailable.
+    """
+    try:
+        data = _read_title_header(path)
+        if data is None:
+            data = _read_title_events(path)
+        if data is None:
+            # full parse goes through the shared cache, so load_profile reuses it
+            data = _load_yaml_file(Path(path))
+        return data.get("title")
+    except Exception:
+        pass
+    return None
+
+
 # ---------------------------
 # Public API
 # ---------------------------
@@ -498,20 +940,48 @@ def list_profiles(lang: str = "en") -> List[Dict[str, str]]:
     ensure_seeded()
 
     # 1) file-backed profiles
+    with os.scandir(USER_PROFILES_DIR) as it:
+        entries = [
+            e for e in it
+            if e.name.endswith(".yaml") and e.name != "domains_index.yaml" and e.is_file()
+        ]
+    entries.sort(key=lambda e: e.name)
+    sigs = [_file_sig(e.path) for e in entries]
+
+    # same files (names + versions) and same domains index -> same list
+    idx_path = _domains_index_path()
+    cache_key = (
+        tuple(zip((e.name for e in entries), sigs)),
+        (str(idx_path), _file_sig(idx_path)) if idx_path is not None else None,
+    )
+    cached = _LIST_CACHE.get(lang)
+    if cached is not None and cached[0] == cache_key:
+        return [dict(d) for d in cached[1]]
+
+    # only (re)read titles of files that are new or changed since the last call
+    stale = []
+    for e, sig in zip(entries, sigs):
+        hit = _TITLE_CACHE.get(e.path)
+        if hit is None or hit[0] != sig:
+            stale.append((e.path, sig))
+
+    # title reads are independent; overlap them on Linux where threaded reads pay off
+    if sys.platform.startswith("linux") and len(stale) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as ex:
+            raw_titles = list(ex.map(lambda item: _read_profile_title(item[0]), stale))
+    else:
+        raw_titles = [_read_profile_title(path) for path, _ in stale]
+    for (path, sig), t in zip(stale, raw_titles):
+        _TITLE_CACHE[path] = (sig, t)
+
     out: List[Dict[str, str]] = []
-    for fn in sorted(USER_PROFILES_DIR.glob("*.yaml")):
-        if fn.name == "domains_index.yaml":
-            continue
-        pid = fn.stem
+    for e in entries:
+        pid = e.name[:-5]
         title = pid.replace("_", " ").title()
-        try:
-            data = yaml.safe_load(_read_text(fn)) or {}
-            if isinstance(data, dict):
-                t = data.get("title")
-                title = str(pick_lang(t, lang) or title).strip() or title
-        except Exception:
-            pass
-        out.append({"id": pid, "filename": fn.name, "title": title})
+        title = str(pick_lang(_TITLE_CACHE[e.path][1], lang) or title).strip() or title
+        out.append({"id": pid, "filename": e.name, "title": title})
 
     existing_ids = {p["id"] for p in out}
 
@@ -526,6 +996,7 @@ def list_profiles(lang: str = "en") -> List[Dict[str, str]]:
 
     # stable order: title then id
     out.sort(key=lambda d: (d.get("title", "").lower(), d.get("id", "").lower()))
+    _LIST_CACHE[lang] = (cache_key, [dict(d) for d in out])
     return out
 
 
@@ -544,15 +1015,28 @@ def load_profile(profile_id: str, lang: str = "en") -> Dict[str, Any]:
 
     ensure_seeded()
 
+    cached = _LOAD_PROFILE_CACHE.get((pid, lang))
+    if cached is not None:
+        sources_sig, cached_prof = cached
+        if all(_file_sig(p) == sig for p, sig in sources_sig):
+            return copy.deepcopy(cached_prof)
+
+    # every file read is recorded with its stat signature (taken before the read)
+    sources: List[_SourceSig] = []
+
+    def load_source(p: Path) -> Dict[str, Any]:
+        sources.append((p, _file_sig(p)))
+        return _load_yaml_file(p)
+
     # 1) Try profile yaml
-    path = profile_path(pid)
-    raw = _load_yaml_file(path)
+    path = _profile_file(pid)
+    raw = load_source(path)
 
     # 2) Fallback: treat domain library as profile if profile yaml missing
     used_fallback = False
     if not raw:
         dom_lib_path = _domain_library_path(pid)
-        dom_lib = _load_yaml_file(dom_lib_path)
+        dom_lib = load_source(dom_lib_path)
         if not dom_lib:
             raise ProfileError(f"Profile not found: {path} (and no domain library at {dom_lib_path})")
         raw = {"id": pid, "domain": pid, **dom_lib}
@@ -563,21 +1047,76 @@ def load_profile(profile_id: str, lang: str = "en") -> Dict[str, Any]:
     domain_id = str(raw.get("domain") or raw.get("id") or pid).strip() or pid
 
     # libraries
-    core_lib = _load_yaml_file(_core_library_path())
-    domain_lib = _load_yaml_file(_domain_library_path(domain_id))
-
-    merged: Dict[str, Any] = {}
-    merged = _merge_profile_like(merged, core_lib, lang=lang)
-    merged = _merge_profile_like(merged, domain_lib, lang=lang)
-    merged = _merge_profile_like(merged, raw, lang=lang)
+    core_path = _core_library_path()
+    core_sig = _file_sig(core_path)
+    sources.append((core_path, core_sig))
+    core_lib = _core_layer(core_path, core_sig, lang)
+    domain_lib = load_source(_domain_library_path(domain_id))
+
+    # lowest priority first: core -> domain -> profile
+    layers = (core_lib, domain_lib, raw)
+    merged = _merge_overrides(layers)
+    merged.update(_merge_list_fields(layers, lang=lang))
+    merged_kw = _merge_keywords(layers, lang=lang)
+    if merged_kw is not None:
+        merged["keywords"] = merged_kw
 
     ok, warnings = validate_profile(merged)
     prof = normalize_profile(merged, fallback_id=pid, lang=lang)
     prof["_warnings"] = warnings
     prof["_source_file"] = ("(domain library)" if used_fallback else path.name)
+
+    _LOAD_PROFILE_CACHE[(pid, lang)] = (tuple(sources), copy.deepcopy(prof))
     return prof
 
 
+def _str_keys_only(x: Any) -> bool:
+    """
+    True when every mapping key in x (recursively) is a str; JSON would turn
+    any other key into a string.
+    """
+    if isinstance(x, dict):
+        return all(type(k) is str and _str_keys_only(v) for k, v in x.items())
+    if isinstance(x, (list, tuple)):
+        return all(_str_keys_only(v) for v in x)
+    return True
+
+
+def _dump_profile(data: Dict[str, Any], f: BinaryIO) -> None:
+    """
+    Serializes a profile dict straight into a binary stream (no intermediate
+    str). With CVB_FAST_DUMP=1 it is written as indented JSON (a YAML subset);
+    data JSON can't round-trip (non-str keys, NaN/inf, dates, ...) falls back
+    to yaml.dump.
+    """
+    if _CVB_FAST_DUMP and _str_keys_only(data):
+        try:
+            text = json.dumps(data, indent=2, ensure_ascii=False, allow_nan=False) + "\n"
+        except (TypeError, ValueError):
+            pass
+        else:
+            f.write(text.encode("utf-8"))
+            return
+    yaml = _yaml()
+    yaml.dump(data, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True, encoding="utf-8")
+
+
+def _prepend_top_level_keys(yaml_text: str, head: Dict[str, Any], expected: Dict[str, Any]) -> Optional[str]:
+    """
+    Prepends `head` as top-level keys to a block-mapping YAML text.
+    Returns None when the result would not parse back to `expected`
+    (keys already present but empty, document markers, flow-style root, ...).
+    """
+    yaml = _yaml()
+    text = yaml.dump(head, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True) + yaml_text
+    try:
+        if yaml.load(text, Loader=_SafeLoader) != expected:
+            return None
+    except yaml.YAMLError:
+        return None
+    return text
+
+
 def save_profile_text(profile_id: str, yaml_text: str) -> None:
     """
     Save raw YAML text (used by profile editor). Validates parse first.
@@ -586,8 +1125,9 @@ def save_profile_text(profile_id: str, yaml_text: str) -> None:
     if not pid:
         raise ProfileError("Empty profile id")
 
+    yaml = _yaml()
     try:
-        parsed = yaml.safe_load(yaml_text)
+        parsed = yaml.load(yaml_text, Loader=_SafeLoader)
         if parsed is None:
             parsed = {}
         if not isinstance(parsed, dict):
@@ -595,11 +1135,26 @@ def save_profile_text(profile_id: str, yaml_text: str) -> None:
     except yaml.YAMLError as e:
         raise ProfileError(f"Invalid YAML: {e}")
 
-    parsed["id"] = parsed.get("id") or pid
-    parsed["domain"] = parsed.get("domain") or parsed["id"]
+    # keep the user's text (comments/formatting) unless id/domain must be filled in
+    head: Dict[str, Any] = {}
+    if not parsed.get("id"):
+        head["id"] = pid
+    if not parsed.get("domain"):
+        head["domain"] = parsed.get("id") or pid
 
-    text_out = yaml.safe_dump(parsed, sort_keys=False, allow_unicode=True)
-    _write_text(profile_path(pid), text_out)
+    path = profile_path(pid)
+    text_out: Optional[str] = yaml_text
+    if head:
+        expected = {**parsed, **head}
+        text_out = _prepend_top_level_keys(yaml_text, head, expected)
+    if text_out is not None:
+        _write_text(path, text_out)
+    else:
+        _write_atomic(path, lambda f: _dump_profile(expected, f))
+    _YAML_CACHE.pop(str(path), None)
+    _TITLE_CACHE.pop(str(path), None)
+    _LIST_CACHE.clear()
+    _LOAD_PROFILE_CACHE.clear()
 
 
 def save_profile_dict(profile: Dict[str, Any], profile_id: Optional[str] = None) -> str:
@@ -615,6 +1170,10 @@ def save_profile_dict(profile: Dict[str, Any], profile_id: Optional[str] = None)
     profile["id"] = profile.get("id") or pid
     profile["domain"] = profile.get("domain") or profile["id"]
 
-    text_out = yaml.safe_dump(profile, sort_keys=False, allow_unicode=True)
-    _write_text(profile_path(pid), text_out)
+    path = _profile_file(pid)
+    _write_atomic(path, lambda f: _dump_profile(profile, f))
+    _YAML_CACHE.pop(str(path), None)
+    _TITLE_CACHE.pop(str(path), None)
+    _LIST_CACHE.clear()
+    _LOAD_PROFILE_CACHE.clear()
     return pid